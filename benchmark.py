@@ -0,0 +1,331 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from textEditor import (ClipboardStack, CursorObserver, DeleteRangeAction, InsertCharacterAction,
+                        LineStore, Location, LocationRange, Profiler, TextEditorModel, TextObserver, UndoManager,
+                        save_lines)
+
+
+class StubCanvas:
+    def __init__(self):
+        self.items = {}
+        self.next_id = 1
+
+    def _create(self, tags):
+        item = self.next_id
+        self.next_id += 1
+        self.items[item] = tags if isinstance(tags, str) else tags[0]
+        return item
+
+    def create_text(self, *args, tags="", tag=None, **kwargs):
+        return self._create(tag or tags)
+
+    def create_rectangle(self, *args, tags="", tag=None, **kwargs):
+        return self._create(tag or tags)
+
+    def create_line(self, *args, tags="", tag=None, **kwargs):
+        return self._create(tag or tags)
+
+    def delete(self, tag):
+        if tag == "all":
+            self.items.clear()
+        else:
+            self.items = {item: t for item, t in self.items.items() if t != tag}
+
+    def find_all(self):
+        return tuple(self.items)
+
+
+def make_text(rnd, lines, width=60):
+    alphabet = "abcdefghijklmnopqrstuvwxyz     "
+    return '\n'.join(''.join(rnd.choices(alphabet, k=rnd.randint(0, width))) for _ in range(lines))
+
+
+def make_keystrokes(rnd, count):
+    return ''.join(rnd.choices("abcdefghijklmnopqrstuvwxyz     \n", k=count))
+
+
+def make_model(document, canvas=None):
+    model = TextEditorModel("")
+    model.lines = document
+    if canvas is not None:
+        model.add_textObserver(TextObserver(canvas, model, 20, 10))
+        model.add_cursorObserver(CursorObserver(canvas, 20, 10))
+    return model
+
+
+def reset_undo():
+    undoManager = UndoManager.get_instance()
+    undoManager.clear()
+    return undoManager
+
+
+def type_text(model, undoManager, text):
+    for c in text:
+        loc = Location(model.cursorLocation.row, model.cursorLocation.column)
+        undoManager.perform(InsertCharacterAction(model, c, loc))
+
+
+def bench_typing(ctx):
+    model = make_model(ctx.text)
+    undoManager = reset_undo()
+    model.cursorLocation = Location(len(model.lines) // 2, 0)
+    typed = make_keystrokes(ctx.rnd, ctx.keystrokes)
+    start = time.perf_counter()
+    type_text(model, undoManager, typed)
+    return time.perf_counter() - start
+
+
+def bench_typing_render(ctx):
+    model = make_model(ctx.small_text, ctx.canvas_factory())
+    undoManager = reset_undo()
+    typed = make_keystrokes(ctx.rnd, 200)
+    start = time.perf_counter()
+    type_text(model, undoManager, typed)
+    return time.perf_counter() - start
+
+
+def bench_paste(ctx):
+    model = make_model(ctx.text)
+    clipboard = ClipboardStack()
+    clipboard.push(ctx.paste_text)
+    model.cursorLocation = Location(len(model.lines) // 2, 0)
+    start = time.perf_counter()
+    model.insert_text(clipboard.peek())
+    return time.perf_counter() - start
+
+
+def bench_delete_range(ctx):
+    model = make_model(ctx.text)
+    undoManager = reset_undo()
+    last = len(model.lines) - 1
+    range_ = LocationRange(Location(1, 0), Location(last, len(model.lines[last])))
+    start = time.perf_counter()
+    undoManager.perform(DeleteRangeAction(model, range_, model.get_text(range_)))
+    undoManager.undo()
+    return time.perf_counter() - start
+
+
+def bench_undo_redo_storm(ctx):
+    model = make_model(ctx.text)
+    undoManager = reset_undo()
+    model.cursorLocation = Location(len(model.lines) // 2, 0)
+    type_text(model, undoManager, make_keystrokes(ctx.rnd, ctx.keystrokes))
+    start = time.perf_counter()
+    while undoManager.undoStack:
+        undoManager.undo()
+    while undoManager.redoStack:
+        undoManager.redo()
+    undoManager.revert_to_version(0)
+    undoManager.revert_to_version(undoManager.history_length())
+    return time.perf_counter() - start
+
+
+def bench_full_redraw(ctx):
+    canvas = ctx.canvas_factory()
+    model = make_model(ctx.small_text, canvas)
+    last = len(model.lines) // 2
+    model.setSelectionRange(LocationRange(Location(0, 0), Location(last, 0)))
+    start = time.perf_counter()
+    model.notify_textObservers()
+    model.notify_cursorObservers(model.cursorLocation)
+    return time.perf_counter() - start
+
+
+def bench_open_save(ctx, size_mb):
+    directory = tempfile.mkdtemp(prefix="texteditor-bench-")
+    filepath = os.path.join(directory, "document.txt")
+    chunk = make_text(random.Random(ctx.seed), 2000) + '\n'
+    with open(filepath, "w", encoding="utf-8") as file:
+        written = 0
+        while written < size_mb * 1024 * 1024:
+            file.write(chunk)
+            written += len(chunk)
+    try:
+        start = time.perf_counter()
+        with open(filepath, "r", encoding="utf-8") as file:
+            model = TextEditorModel(file.read())
+        save_lines(filepath, model.lines)
+        return time.perf_counter() - start
+    finally:
+        os.remove(filepath)
+        os.rmdir(directory)
+
+
+class Context:
+    def __init__(self, args):
+        self.seed = args.seed
+        self.rnd = random.Random(args.seed)
+        self.text = LineStore(make_text(self.rnd, args.lines).split('\n')).freeze()
+        self.small_text = LineStore(make_text(self.rnd, args.render_lines).split('\n')).freeze()
+        self.paste_text = make_text(self.rnd, args.lines // 10)
+        self.keystrokes = args.keystrokes
+        self.canvas_factory = StubCanvas
+        if args.tk:
+            import tkinter as tk
+            root = tk.Tk()
+            root.withdraw()
+            self.canvas_factory = lambda: tk.Canvas(root)
+
+
+BENCHMARKS = {
+    "typing": bench_typing,
+    "typing_render": bench_typing_render,
+    "paste": bench_paste,
+    "delete_range": bench_delete_range,
+    "undo_redo_storm": bench_undo_redo_storm,
+    "full_redraw": bench_full_redraw,
+}
+
+
+def measure(function, ctx, seed, min_time, max_iterations=10000):
+    # Kratki benchmarki ponavljaju se dok ukupno mjereno vrijeme ne prijede
+    # min_time, pa uzorak nije sum mjerenja reda velicine mikrosekunde.
+    total = 0.0
+    iterations = 0
+    while total < min_time and iterations < max_iterations:
+        ctx.rnd = random.Random(seed)
+        total += function(ctx)
+        iterations += 1
+    return total / iterations, iterations
+
+
+def run(args):
+    ctx = Context(args)
+    benchmarks = list(BENCHMARKS.items())
+    for size_mb in args.sizes:
+        benchmarks.append((f"open_save_{size_mb}mb", lambda ctx, size_mb=size_mb: bench_open_save(ctx, size_mb)))
+    if args.only:
+        benchmarks = [(name, function) for name, function in benchmarks if name in args.only]
+
+    results = {}
+    for name, function in benchmarks:
+        timings = []
+        iterations = []
+        for _ in range(args.repeat):
+            timing, count = measure(function, ctx, args.seed, args.min_time)
+            timings.append(timing)
+            iterations.append(count)
+        results[name] = {
+            "min_s": min(timings),
+            "median_s": statistics.median(timings),
+            "max_s": max(timings),
+            "iterations": iterations,
+            "runs": timings,
+        }
+        print(f"{name:<24}{results[name]['median_s'] * 1000:12.2f} ms (min {results[name]['min_s'] * 1000:.2f} ms)")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "environment": environment(),
+        "parameters": {
+            "seed": args.seed, "lines": args.lines, "render_lines": args.render_lines,
+            "keystrokes": args.keystrokes, "repeat": args.repeat, "min_time": args.min_time,
+            "sizes_mb": args.sizes, "tk": args.tk,
+        },
+        "results": results,
+    }
+
+
+def environment():
+    # Samo ono sto bitno mijenja brzinu; verzija kernela i patch verzija
+    # Pythona se ne usporeduju strogo, inace svaka nadogradnja ponistava baseline.
+    return {
+        "implementation": platform.python_implementation(),
+        "python_version": ".".join(platform.python_version_tuple()[:2]),
+        "system": platform.system(),
+        "machine": platform.machine(),
+    }
+
+
+def baseline_mismatches(report, baseline):
+    mismatches = []
+    warnings = []
+    previous = baseline.get("environment")
+    if previous is None:
+        warnings.append("baseline nema podatke o okruzenju")
+    else:
+        for key, value in report["environment"].items():
+            if previous.get(key) != value:
+                mismatches.append(f"{key}: {previous.get(key)} != {value}")
+    for key in ("python", "platform"):
+        if report[key] != baseline.get(key):
+            warnings.append(f"{key}: {baseline.get(key)} != {report[key]}")
+    parameters = baseline.get("parameters", {})
+    for key, value in report["parameters"].items():
+        if parameters.get(key) != value:
+            mismatches.append(f"{key}: {parameters.get(key)} != {value}")
+    return mismatches, warnings
+
+
+def compare(report, baseline, threshold):
+    # Regresija je samo ako je medijan sporiji od praga i ako je najbrze
+    # mjerenje sporije od najsporijeg mjerenja u baselineu.
+    regressions = []
+    print()
+    print(f"{'benchmark':<24}{'baseline ms':>14}{'current ms':>14}{'ratio':>8}")
+    for name, result in report["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        ratio = result["median_s"] / previous["median_s"] if previous["median_s"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold and result["min_s"] > previous.get("max_s", previous["median_s"]):
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<24}{previous['median_s'] * 1000:14.2f}{result['median_s'] * 1000:14.2f}{ratio:8.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarkovi za model, undo i iscrtavanje")
+    parser.add_argument("--lines", type=int, default=200000, help="broj linija velikog dokumenta")
+    parser.add_argument("--render-lines", type=int, default=2000, help="broj linija dokumenta za iscrtavanje")
+    parser.add_argument("--keystrokes", type=int, default=4000, help="broj znakova za tipkanje")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[10],
+                        help="velicine datoteka u MB za open/save (npr. 10 100 1024)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.1,
+                        help="najmanje mjereno vrijeme po uzorku u sekundama (zadano: 0.1)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--only", nargs="*", help="pokreni samo navedene benchmarke")
+    parser.add_argument("--tk", action="store_true", help="iscrtavaj na pravom Tk Canvasu (npr. pod xvfb-run)")
+    parser.add_argument("--output", help="spremi rezultate kao JSON")
+    parser.add_argument("--baseline", help="usporedi s ranije spremljenim JSON rezultatima")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="dopusteno usporenje prema baselineu (zadano: 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    Profiler.get_instance().enabled = False
+    report = run(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        mismatches, warnings = baseline_mismatches(report, baseline)
+        for warning in warnings:
+            print(f"Upozorenje: {warning}")
+        if mismatches:
+            print("Baseline nije usporediv s ovim mjerenjem:")
+            for mismatch in mismatches:
+                print(f"  {mismatch}")
+            return 2
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"Regresije: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
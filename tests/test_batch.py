@@ -0,0 +1,46 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from textEditor import run_batch
+
+CRASHING_SCRIPT = """
+import os
+def execute(model, undoManager, clipboardStack):
+    if model.lines[0] == "crash":
+        os._exit(3)
+    model.lines[0] = "edited"
+"""
+
+
+class RunBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.script = self.write("script.py", CRASHING_SCRIPT)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        filepath = os.path.join(self.directory.name, name)
+        with open(filepath, "w", encoding="utf-8") as file:
+            file.write(content)
+        return filepath
+
+    def test_crashed_worker_is_reported_as_failed(self):
+        files = [self.write("crash.txt", "crash\n"), self.write("ok.txt", "ok\n")]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            failures = run_batch(files, script_path=self.script, jobs=1)
+        self.assertGreaterEqual(failures, 1)
+        self.assertIn("FAILED", output.getvalue())
+        self.assertIn(f"{len(files)} files", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from textEditor import LineStore, Location, LocationRange, TextEditorModel
+
+
+class LineStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.chunkSize = LineStore.CHUNK_SIZE
+        LineStore.CHUNK_SIZE = 4
+
+    def tearDown(self):
+        LineStore.CHUNK_SIZE = self.chunkSize
+
+    def test_matches_list_under_random_edits(self):
+        rnd = random.Random(7)
+        expected = [f"l{i}" for i in range(50)]
+        store = LineStore(expected)
+        for step in range(2000):
+            op = rnd.random()
+            n = len(expected)
+            if op < 0.3 and n:
+                i = rnd.randrange(n)
+                expected[i] = store[i] = f"s{step}"
+            elif op < 0.5:
+                i = rnd.randint(0, n)
+                expected.insert(i, f"i{step}")
+                store.insert(i, f"i{step}")
+            elif op < 0.7 and n:
+                i = rnd.randrange(n)
+                del expected[i]
+                del store[i]
+            else:
+                a = rnd.randint(0, n)
+                b = rnd.randint(a, min(n, a + 12))
+                new = [f"r{step}.{k}" for k in range(rnd.randint(0, 15))]
+                expected[a:b] = new
+                store[a:b] = new
+            self.assertEqual(len(store), len(expected))
+            a = rnd.randint(0, len(expected))
+            b = rnd.randint(a, len(expected))
+            self.assertEqual(store[a:b], expected[a:b])
+        self.assertEqual(list(store), expected)
+
+    def test_frozen_view_is_unchanged_by_later_edits(self):
+        store = LineStore([f"l{i}" for i in range(40)])
+        frozen = store.freeze()
+        store[3] = "changed"
+        del store[10:20]
+        store.insert(0, "first")
+        self.assertEqual(list(frozen), [f"l{i}" for i in range(40)])
+        with self.assertRaises(TypeError):
+            frozen[0] = "x"
+
+    def test_edit_after_freeze_copies_only_touched_chunk(self):
+        store = LineStore([f"l{i}" for i in range(40)])
+        frozen = store.freeze()
+        store[5] = "changed"
+        shared = sum(a is b for a, b in zip(store._chunks, frozen._chunks))
+        self.assertEqual(shared, len(frozen._chunks) - 1)
+
+
+    def test_list_methods_used_by_plugins(self):
+        store = LineStore(["c", "a", "b"])
+        frozen = store.freeze()
+        copy = store.copy()
+        self.assertIsInstance(copy, list)
+        store.sort()
+        self.assertEqual(list(store), ["a", "b", "c"])
+        store.sort(key=len, reverse=True)
+        self.assertEqual(store + ["d"], ["a", "b", "c", "d"])
+        self.assertEqual(["z"] + store, ["z", "a", "b", "c"])
+        store += ["d", "e"]
+        self.assertEqual(list(store), ["a", "b", "c", "d", "e"])
+        store.clear()
+        self.assertEqual(len(store), 0)
+        self.assertEqual(list(frozen), ["c", "a", "b"])
+        self.assertEqual(copy, ["c", "a", "b"])
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_snapshot_keeps_text_and_current_cursor(self):
+        model = TextEditorModel("abc\ndef\nghi")
+        first = model.snapshot()
+        model.cursorLocation = Location(1, 2)
+        second = model.snapshot()
+        self.assertEqual(second.cursorLocation.column, 2)
+        model.replace(LocationRange(Location(0, 1), Location(2, 1)), "X")
+        self.assertEqual(list(first), ["abc", "def", "ghi"])
+        self.assertEqual(list(model.lines), ["aXhi"])
+
+
+if __name__ == "__main__":
+    unittest.main()
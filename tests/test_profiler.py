@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from textEditor import ClipboardStack, InsertCharacterAction, Location, Profiler, TextEditorModel, UndoManager
+
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self.profiler = Profiler.get_instance()
+        self.profiler.reset()
+
+    def test_input_start_includes_queue_delay(self):
+        event_time = 1000
+        first = self.profiler.input_start(event_time)
+        self.assertAlmostEqual(first, time.perf_counter(), delta=0.01)
+        time.sleep(0.05)
+        queued = self.profiler.input_start(event_time + 10)
+        self.assertGreater(time.perf_counter() - queued, 0.035)
+
+    def test_input_start_without_event_time(self):
+        self.assertAlmostEqual(self.profiler.input_start(0), time.perf_counter(), delta=0.01)
+
+    def test_memory_usage_counts_checkpoints(self):
+        undoManager = UndoManager.get_instance()
+        undoManager.clear()
+        model = TextEditorModel("\n".join("x" * 40 for _ in range(5000)))
+        for i in range(UndoManager.CHECKPOINT_INTERVAL + 1):
+            undoManager.perform(InsertCharacterAction(model, "a", Location(i % 5000, 0)))
+        memory = Profiler.memory_usage(undoManager, ClipboardStack())
+        self.assertEqual(memory["checkpoints"], 2)
+        self.assertGreater(memory["checkpoint_bytes"], 0)
+        exact = Profiler.memory_usage(undoManager, ClipboardStack(), exact=True)
+        self.assertGreaterEqual(exact["checkpoint_bytes"], memory["checkpoint_bytes"])
+        undoManager.clear()
+
+    def test_memory_usage_tracks_history_bytes_without_walking_stacks(self):
+        undoManager = UndoManager.get_instance()
+        undoManager.clear()
+        model = TextEditorModel("abc\ndef")
+        for c in "ab\ncd":
+            loc = Location(model.cursorLocation.row, model.cursorLocation.column)
+            undoManager.perform(InsertCharacterAction(model, c, loc))
+        undoManager.undo()
+        undoManager.undo()
+        expected = sum(UndoManager.action_bytes(a) for a in undoManager.undoStack + undoManager.redoStack)
+        self.assertEqual(Profiler.memory_usage(undoManager, ClipboardStack())["undo_bytes"], expected)
+        undoManager.perform(InsertCharacterAction(model, "x", Location(0, 0)))
+        expected = sum(UndoManager.action_bytes(a) for a in undoManager.undoStack)
+        self.assertEqual(Profiler.memory_usage(undoManager, ClipboardStack())["undo_bytes"], expected)
+        undoManager.clear()
+        self.assertEqual(Profiler.memory_usage(undoManager, ClipboardStack())["undo_bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
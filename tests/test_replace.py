@@ -0,0 +1,68 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from textEditor import DeleteRangeAction, Location, LocationRange, TextEditorModel, UndoManager
+
+
+def range_(start_row, start_column, end_row, end_column):
+    return LocationRange(Location(start_row, start_column), Location(end_row, end_column))
+
+
+class ReplaceTest(unittest.TestCase):
+    def setUp(self):
+        self.model = TextEditorModel("hello world\nab\nlast line")
+
+    def test_get_text_single_line(self):
+        self.assertEqual(self.model.get_text(range_(0, 6, 0, 11)), "world")
+        self.assertEqual(self.model.get_text(range_(1, 1, 1, 1)), "")
+
+    def test_get_text_multi_line(self):
+        self.assertEqual(self.model.get_text(range_(0, 6, 2, 4)), "world\nab\nlast")
+
+    def test_replace_single_line(self):
+        removed = self.model.replace(range_(0, 0, 0, 5), "bye")
+        self.assertEqual(removed, "hello")
+        self.assertEqual(list(self.model.lines), ["bye world", "ab", "last line"])
+        self.assertEqual((self.model.cursorLocation.row, self.model.cursorLocation.column), (0, 3))
+
+    def test_replace_multi_line_with_empty_text(self):
+        removed = self.model.replace(range_(0, 5, 2, 4), "")
+        self.assertEqual(removed, " world\nab\nlast")
+        self.assertEqual(list(self.model.lines), ["hello line"])
+        self.assertEqual((self.model.cursorLocation.row, self.model.cursorLocation.column), (0, 5))
+
+    def test_replace_with_text_containing_newlines(self):
+        self.model.replace(range_(1, 1, 1, 1), "X\nYZ\n")
+        self.assertEqual(list(self.model.lines), ["hello world", "aX", "YZ", "b", "last line"])
+        self.assertEqual((self.model.cursorLocation.row, self.model.cursorLocation.column), (3, 0))
+
+    def test_delete_round_trips_through_undo(self):
+        undoManager = UndoManager.get_instance()
+        undoManager.clear()
+        selection = range_(0, 6, 2, 4)
+        undoManager.perform(DeleteRangeAction(self.model, selection, self.model.get_text(selection)))
+        self.assertEqual(list(self.model.lines), ["hello  line"])
+        undoManager.undo()
+        self.assertEqual(list(self.model.lines), ["hello world", "ab", "last line"])
+        undoManager.redo()
+        self.assertEqual(list(self.model.lines), ["hello  line"])
+        undoManager.clear()
+
+    def test_reversed_range(self):
+        # Shift+Down s (0, 5) na kracu liniju daje start=(1, 2), end=(0, 5).
+        reversed_ = range_(1, 2, 0, 5)
+        self.assertEqual(self.model.get_text(reversed_), " world\nab")
+        undoManager = UndoManager.get_instance()
+        undoManager.clear()
+        undoManager.perform(DeleteRangeAction(self.model, reversed_, self.model.get_text(reversed_)))
+        self.assertEqual(list(self.model.lines), ["hello", "last line"])
+        undoManager.undo()
+        self.assertEqual(list(self.model.lines), ["hello world", "ab", "last line"])
+        undoManager.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from textEditor import save_lines
+
+
+class SaveLinesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.directory.name, "document.txt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @unittest.skipIf(os.name != "posix", "prava datoteka su POSIX")
+    def test_new_file_gets_umask_mode(self):
+        umask = os.umask(0o022)
+        try:
+            save_lines(self.filepath, ["a", "b"])
+        finally:
+            os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(self.filepath).st_mode), 0o644)
+
+    @unittest.skipIf(os.name != "posix", "prava datoteka su POSIX")
+    def test_existing_file_keeps_mode(self):
+        with open(self.filepath, "w") as file:
+            file.write("old")
+        os.chmod(self.filepath, 0o640)
+        save_lines(self.filepath, ["new"])
+        self.assertEqual(stat.S_IMODE(os.stat(self.filepath).st_mode), 0o640)
+
+    def test_writes_lines_with_requested_newline(self):
+        save_lines(self.filepath, ["a", "b", ""], chunk_size=1, newline="\r\n")
+        with open(self.filepath, "rb") as file:
+            self.assertEqual(file.read(), b"a\r\nb\r\n")
+        self.assertEqual(os.listdir(self.directory.name), ["document.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from textEditor import (DeleteRangeAction, InsertCharacterAction, LineStore, Location, LocationRange,
+                        TextEditorModel, UndoManager)
+
+
+class UndoCheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.saved = (UndoManager.CHECKPOINT_INTERVAL, UndoManager.MAX_CHECKPOINTS, LineStore.CHUNK_SIZE)
+        UndoManager.CHECKPOINT_INTERVAL = 7
+        UndoManager.MAX_CHECKPOINTS = 4
+        LineStore.CHUNK_SIZE = 4
+        self.undoManager = UndoManager.get_instance()
+        self.undoManager.clear()
+
+    def tearDown(self):
+        UndoManager.CHECKPOINT_INTERVAL, UndoManager.MAX_CHECKPOINTS, LineStore.CHUNK_SIZE = self.saved
+        self.undoManager.clear()
+
+    def random_action(self, rnd, model):
+        cursor = Location(model.cursorLocation.row, model.cursorLocation.column)
+        if rnd.random() < 0.8 or len(model.lines) < 2:
+            return InsertCharacterAction(model, rnd.choice("ab\n"), cursor)
+        row = rnd.randrange(len(model.lines) - 1)
+        end = rnd.randint(row + 1, min(len(model.lines) - 1, row + 5))
+        range_ = LocationRange(Location(row, rnd.randint(0, len(model.lines[row]))),
+                               Location(end, rnd.randint(0, len(model.lines[end]))))
+        return DeleteRangeAction(model, range_, model.get_text(range_))
+
+    def test_revert_to_version_matches_recorded_states(self):
+        rnd = random.Random(3)
+        model = TextEditorModel("\n".join(f"line {i}" for i in range(30)))
+        states = [list(model.lines)]
+        for step in range(400):
+            self.undoManager.perform(self.random_action(rnd, model))
+            states.append(list(model.lines))
+            if step == 200:
+                self.undoManager.revert_to_version(120)
+                self.assertEqual(list(model.lines), states[120])
+                states = states[:121]
+
+        self.assertLessEqual(len(self.undoManager.checkpoints), UndoManager.MAX_CHECKPOINTS)
+        last = len(states) - 1
+        for version in [0, 5, last, 37, 12, last - 3, 0, last, last // 2] + rnd.sample(range(last + 1), 20):
+            self.undoManager.revert_to_version(version)
+            self.assertEqual(list(model.lines), states[version], version)
+
+    def run_typing(self, model, rows):
+        sizes = []
+        add_checkpoint = self.undoManager.add_checkpoint
+
+        def measured_add_checkpoint(position, model):
+            add_checkpoint(position, model)
+            budget = UndoManager.CHECKPOINT_MEMORY_RATIO * model.lines.estimate_bytes()
+            sizes.append((self.undoManager.checkpoint_memory(), budget))
+
+        self.undoManager.add_checkpoint = measured_add_checkpoint
+        try:
+            for row in rows:
+                self.undoManager.perform(InsertCharacterAction(model, "a", Location(row, 0)))
+        finally:
+            del self.undoManager.add_checkpoint
+        return sizes
+
+    def test_checkpoint_memory_is_bounded_by_document_size(self):
+        UndoManager.CHECKPOINT_INTERVAL = 50
+        UndoManager.MAX_CHECKPOINTS = 1000
+        saved = UndoManager.MIN_CHECKPOINT_MEMORY
+        UndoManager.MIN_CHECKPOINT_MEMORY = 0
+        try:
+            model = TextEditorModel("\n".join("x" * 40 for _ in range(2000)))
+            sizes = self.run_typing(model, [(i * 37) % 2000 for i in range(5000)])
+            self.assertGreater(len(sizes), 1)
+            for size, budget in sizes:
+                self.assertLessEqual(size, budget)
+
+            self.undoManager.clear()
+            model = TextEditorModel("\n".join("x" * 40 for _ in range(2000)))
+            self.run_typing(model, [i // 100 for i in range(5000)])
+            self.assertGreater(len(self.undoManager.checkpoints), 3)
+        finally:
+            UndoManager.MIN_CHECKPOINT_MEMORY = saved
+
+    def type_text(self, model, text):
+        for c in text:
+            cursor = Location(model.cursorLocation.row, model.cursorLocation.column)
+            self.undoManager.perform(InsertCharacterAction(model, c, cursor))
+
+    def test_revert_keeps_edits_made_outside_undo_history(self):
+        model = TextEditorModel("abc\ndef")
+        self.type_text(model, "hello")
+        model.insert_text("PASTED\nTEXT")
+        self.type_text(model, "xy")
+        expected = list(model.lines)
+        self.assertEqual(expected, ["helloPASTED", "TEXTxyabc", "def"])
+
+        self.undoManager.revert_to_version(0)
+        self.undoManager.revert_to_version(self.undoManager.history_length())
+        self.assertEqual(list(model.lines), expected)
+
+        # Plugin koji pise izravno u model.lines ne prolazi kroz _begin_edit.
+        model.lines.append("plugin")
+        self.type_text(model, "z")
+        self.assertEqual([c[0] for c in self.undoManager.checkpoints], [7])
+
+    def test_checkpoints_survive_edits_through_history(self):
+        UndoManager.CHECKPOINT_INTERVAL = 1
+        UndoManager.MAX_CHECKPOINTS = 100
+        self.undoManager.clear()
+        model = TextEditorModel("abc")
+        self.type_text(model, "hello")
+        self.undoManager.undo()
+        self.undoManager.revert_to_version(2)
+        self.type_text(model, "xy")
+        self.assertEqual([c[0] for c in self.undoManager.checkpoints], [0, 1, 2, 3])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,18 @@
-import tkinter as tk
-from tkinter import filedialog
 from abc import ABC, abstractmethod
-import tkinter.messagebox as messagebox
 import importlib.util
 import os
 import sys
 import inspect
+import argparse
+import tempfile
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import json
+from collections import deque
+from collections.abc import MutableSequence
+import time
+import bisect
 
 class Plugin(ABC):
     @abstractmethod
@@ -43,8 +50,130 @@ class LocationRange:
         self.end = end
     def __repr__(self):
         return f"LocationRange(start={self.start}, end={self.end})"
+    def ordered(self):
+        # Selekcija moze imati kraj prije pocetka (npr. Shift+Down na kracu liniju).
+        if (self.end.row, self.end.column) < (self.start.row, self.start.column):
+            return LocationRange(self.end, self.start)
+        return self
+class Profiler:
+    _instance = None
+    MAX_EVENTS = 100000
+
+    def __init__(self):
+        if Profiler._instance is not None:
+            raise Exception("This is a singleton!")
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.events = deque(maxlen=Profiler.MAX_EVENTS)
+        self.counters = deque(maxlen=Profiler.MAX_EVENTS)
+        self.stats = {}
+        self.inputClockOffset = None
+        Profiler._instance = self
+
+    @staticmethod
+    def get_instance():
+        if Profiler._instance is None:
+            Profiler()
+        return Profiler._instance
+
+    def reset(self):
+        self.origin = time.perf_counter()
+        self.events.clear()
+        self.counters.clear()
+        self.stats.clear()
+        self.inputClockOffset = None
+
+    def record(self, name, category, start, args=None):
+        duration = time.perf_counter() - start
+        self.events.append((name, category, start, duration, args))
+        stat = self.stats.get(name)
+        if stat is None:
+            self.stats[name] = [1, duration, duration]
+        else:
+            stat[0] += 1
+            stat[1] += duration
+            if duration > stat[2]:
+                stat[2] = duration
+
+    def input_start(self, event_time):
+        # Tk event.time je u milisekundama po satu X servera. Najmanja
+        # uocena razlika prema perf_counter() uzima se kao dogadaj bez
+        # cekanja u redu, pa ostali dogadaji ukljucuju kasnjenje reda.
+        now = time.perf_counter()
+        if not isinstance(event_time, int) or event_time <= 0:
+            return now
+        offset = now * 1000 - event_time
+        if self.inputClockOffset is None or offset < self.inputClockOffset or offset - self.inputClockOffset > 60000:
+            self.inputClockOffset = offset
+        return (event_time + self.inputClockOffset) / 1000
+
+    def counter(self, name, value):
+        self.counters.append((name, time.perf_counter(), value))
+
+    def summary(self):
+        result = {}
+        for name, (count, total, maximum) in sorted(self.stats.items(), key=lambda item: -item[1][1]):
+            result[name] = {
+                "count": count,
+                "total_ms": total * 1000,
+                "avg_ms": total * 1000 / count,
+                "max_ms": maximum * 1000,
+            }
+        return result
+
+    @staticmethod
+    def memory_usage(undoManager, clipboardStack, exact=False):
+        # Bez `exact` koriste se velicine koje UndoManager pamti pri push()
+        # i pri dodavanju kontrolne tocke, pa je poziv jeftin i za panel.
+        return {
+            "undo_entries": len(undoManager.undoStack),
+            "redo_entries": len(undoManager.redoStack),
+            "undo_bytes": undoManager.historyBytes,
+            "checkpoints": len(undoManager.checkpoints),
+            "checkpoint_bytes": undoManager.checkpoint_memory() if exact else undoManager.checkpointBytes,
+            "clipboard_entries": len(clipboardStack.texts),
+            "clipboard_bytes": sum(sys.getsizeof(text) for text in clipboardStack.texts),
+        }
+
+    def export_json(self, filepath, memory=None):
+        data = {
+            "summary": self.summary(),
+            "memory": memory,
+            "events": [
+                {"name": name, "category": category, "start_ms": (start - self.origin) * 1000,
+                 "duration_ms": duration * 1000, "args": args}
+                for name, category, start, duration, args in self.events
+            ],
+            "counters": [
+                {"name": name, "time_ms": (at - self.origin) * 1000, "value": value}
+                for name, at, value in self.counters
+            ],
+        }
+        with open(filepath, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=1)
+
+    def export_chrome_trace(self, filepath):
+        pid = os.getpid()
+        trace = []
+        for name, category, start, duration, args in self.events:
+            event = {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": 1,
+                     "ts": (start - self.origin) * 1e6, "dur": duration * 1e6}
+            if args:
+                event["args"] = args
+            trace.append(event)
+        for name, at, value in self.counters:
+            trace.append({"name": name, "ph": "C", "pid": pid, "tid": 1,
+                          "ts": (at - self.origin) * 1e6, "args": {name: value}})
+        with open(filepath, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, file)
+
+
 class UndoManager:
     _instance = None
+    CHECKPOINT_INTERVAL = 500
+    MAX_CHECKPOINTS = 64
+    CHECKPOINT_MEMORY_RATIO = 0.5
+    MIN_CHECKPOINT_MEMORY = 1 << 20
 
     def __init__(self):
         if UndoManager._instance is not None:
@@ -52,6 +181,11 @@ class UndoManager:
         self.undoStack = []
         self.redoStack = []
         self.observers = []
+        self.checkpoints = []
+        self.checkpointInterval = UndoManager.CHECKPOINT_INTERVAL
+        self.expectedState = None
+        self.historyBytes = 0
+        self.checkpointBytes = 0
         UndoManager._instance = self
 
     @staticmethod
@@ -62,23 +196,195 @@ class UndoManager:
 
     def undo(self):
         if self.undoStack:
+            self.check_external_edits(getattr(self.undoStack[-1], "model", None))
             action = self.undoStack.pop()
-            action.execute_undo()
+            profiler = Profiler.get_instance()
+            if profiler.enabled:
+                start = time.perf_counter()
+                action.execute_undo()
+                profiler.record(f"{type(action).__name__}.execute_undo", "action", start)
+            else:
+                action.execute_undo()
+            self.track_state(getattr(action, "model", None))
             self.redoStack.append(action)
             self.notify_observers()
 
     def redo(self):
         if self.redoStack:
+            self.check_external_edits(getattr(self.redoStack[-1], "model", None))
             action = self.redoStack.pop()
-            action.execute_do()
+            profiler = Profiler.get_instance()
+            if profiler.enabled:
+                start = time.perf_counter()
+                action.execute_do()
+                profiler.record(f"{type(action).__name__}.execute_do", "action", start)
+            else:
+                action.execute_do()
+            self.track_state(getattr(action, "model", None))
             self.undoStack.append(action)
             self.notify_observers()
 
+    def perform(self, action: EditAction):
+        self.push(action)
+        profiler = Profiler.get_instance()
+        if profiler.enabled:
+            start = time.perf_counter()
+            action.execute_do()
+            profiler.record(f"{type(action).__name__}.execute_do", "action", start)
+        else:
+            action.execute_do()
+        self.track_state(getattr(action, "model", None))
+        # Neke akcije tek pri izvrsavanju spremaju tekst koji vracaju.
+        size = UndoManager.action_bytes(action)
+        self.historyBytes += size - action.cachedBytes
+        action.cachedBytes = size
+
     def push(self, action: EditAction):
-        self.redoStack.clear()
+        self.check_external_edits(getattr(action, "model", None))
+        # Kod push() pa execute_do() stanje nakon akcije nije poznato;
+        # perform() ga biljezi, a inace sljedeca provjera brise tocke.
+        self.expectedState = None
+        position = len(self.undoStack)
+        if self.redoStack:
+            self.historyBytes -= sum(a.cachedBytes for a in self.redoStack)
+            self.redoStack.clear()
+            while self.checkpoints and self.checkpoints[-1][0] > position:
+                self.checkpoints.pop()
+            self.checkpointBytes = sum(c[3] for c in self.checkpoints[:-1])
+        if position % self.checkpointInterval == 0:
+            self.add_checkpoint(position, getattr(action, "model", None))
+        action.timestamp = time.time()
+        action.cachedBytes = UndoManager.action_bytes(action)
+        self.historyBytes += action.cachedBytes
         self.undoStack.append(action)
         self.notify_observers()
 
+    def clear(self):
+        self.undoStack.clear()
+        self.redoStack.clear()
+        self.checkpoints.clear()
+        self.checkpointInterval = UndoManager.CHECKPOINT_INTERVAL
+        self.expectedState = None
+        self.historyBytes = 0
+        self.checkpointBytes = 0
+        self.notify_observers()
+
+    @staticmethod
+    def action_bytes(action):
+        size = sys.getsizeof(action)
+        for value in vars(action).values():
+            if isinstance(value, str):
+                size += sys.getsizeof(value)
+        return size
+
+    def check_external_edits(self, model):
+        # Izmjene mimo undo povijesti (paste, set_text, plugin koji pise u
+        # model.lines) ne mogu se ponoviti iz kontrolne tocke, pa se tocke
+        # brisu i revert_to_version koraca kroz undo/redo.
+        if model is None or not self.checkpoints:
+            return
+        if self.expectedState != (model, model.edit_state()):
+            self.checkpoints.clear()
+            self.checkpointBytes = 0
+
+    def track_state(self, model):
+        self.expectedState = None if model is None else (model, model.edit_state())
+
+    def add_checkpoint(self, position, model):
+        # Akcija se dodaje prije izvrsavanja, pa snimka odgovara stanju
+        # nakon prvih `position` akcija.
+        if model is None:
+            return
+        if self.checkpoints and self.checkpoints[-1][0] == position:
+            self.checkpoints.pop()
+        self.checkpoints.append([position, model, model.snapshot(), 0])
+        self._update_checkpoint_sizes(len(self.checkpoints) - 2)
+        budget = max(UndoManager.CHECKPOINT_MEMORY_RATIO * model.lines.estimate_bytes(),
+                      UndoManager.MIN_CHECKPOINT_MEMORY)
+        memory = self.checkpoint_memory()
+        while len(self.checkpoints) > UndoManager.MAX_CHECKPOINTS or memory > budget:
+            if len(self.checkpoints) == 1:
+                self.checkpoints.clear()
+                memory = 0
+                break
+            self.checkpointInterval *= 2
+            self.checkpoints = [c for c in self.checkpoints if c[0] % self.checkpointInterval == 0]
+            self._update_checkpoint_sizes(0)
+            memory = self.checkpoint_memory()
+        self.checkpointBytes = memory
+
+    def _update_checkpoint_sizes(self, first):
+        # Kontrolna tocka drzi samo komade (i linije) koje novija tocka
+        # vise ne dijeli s njom; ta se velicina ne mijenja dok obje postoje.
+        for i in range(max(first, 0), len(self.checkpoints) - 1):
+            self.checkpoints[i][3] = self.checkpoints[i][2]._lines.unique_bytes(self.checkpoints[i + 1][2]._lines)
+
+    def checkpoint_memory(self):
+        if not self.checkpoints:
+            return 0
+        newest = self.checkpoints[-1]
+        return sum(c[3] for c in self.checkpoints[:-1]) + newest[2]._lines.unique_bytes(newest[1].lines)
+
+    def history_length(self):
+        return len(self.undoStack) + len(self.redoStack)
+
+    def revert_to_version(self, version: int):
+        if not 0 <= version <= self.history_length():
+            raise ValueError(f"Version {version} is not in history")
+        position = len(self.undoStack)
+        if version == position:
+            return
+        start = time.perf_counter()
+        if self.checkpoints:
+            self.check_external_edits(self.checkpoints[-1][1])
+
+        timeline = self.undoStack + self.redoStack[::-1]
+        checkpoint = None
+        i = bisect.bisect_right(self.checkpoints, version, key=lambda c: c[0])
+        if i > 0 and version - self.checkpoints[i - 1][0] < abs(version - position):
+            checkpoint = self.checkpoints[i - 1]
+
+        if checkpoint is not None:
+            replay = timeline[checkpoint[0]:version]
+        else:
+            replay = timeline[min(position, version):max(position, version)]
+        models = {getattr(action, "model", None) for action in replay}
+        if checkpoint is not None:
+            models.add(checkpoint[1])
+        models.discard(None)
+
+        for model in models:
+            model.suspend_notifications()
+        try:
+            if checkpoint is not None:
+                checkpoint[1].restore(checkpoint[2])
+                for action in replay:
+                    action.execute_do()
+                self.undoStack = timeline[:version]
+                self.redoStack = timeline[version:][::-1]
+            else:
+                while len(self.undoStack) > version:
+                    action = self.undoStack.pop()
+                    action.execute_undo()
+                    self.redoStack.append(action)
+                while len(self.undoStack) < version:
+                    action = self.redoStack.pop()
+                    action.execute_do()
+                    self.undoStack.append(action)
+        finally:
+            for model in models:
+                model.resume_notifications()
+        self.track_state(next(iter(models)) if len(models) == 1 else None)
+        self.notify_observers()
+        profiler = Profiler.get_instance()
+        if profiler.enabled:
+            profiler.record("UndoManager.revert_to_version", "action", start,
+                            {"from": position, "to": version, "checkpoint": checkpoint is not None})
+
+    def revert_to_time(self, timestamp: float):
+        timeline = self.undoStack + self.redoStack[::-1]
+        self.revert_to_version(bisect.bisect_right(timeline, timestamp, key=lambda a: a.timestamp))
+
     def add_observer(self, observer: UndoObserver):
         self.observers.append(observer)
 
@@ -99,6 +405,7 @@ class InsertCharacterAction(EditAction):
 
     def execute_do(self):
         self.model.cursorLocation = Location(self.location.row, self.location.column)
+        self.model.setSelectionRange(None)
         if self.char == '\n':
             line = self.model.lines[self.location.row]
             self.after_text = line[self.location.column:] 
@@ -108,15 +415,7 @@ class InsertCharacterAction(EditAction):
         if self.char == '\n':
             row = self.location.row
             col = self.location.column
-
-            self.model.cursorLocation = Location(row, col)
-
-            self.model.lines[row] = self.model.lines[row] + self.model.lines[row + 1]
-            del self.model.lines[row + 1]
-
-            self.model.setSelectionRange(None)
-            self.model.notify_textObservers()
-            self.model.notify_cursorObservers(self.model.cursorLocation)
+            self.model.replace(LocationRange(Location(row, col), Location(row + 1, 0)), "")
         else:
             self.model.cursorLocation = Location(self.location.row, self.location.column)
             self.model.delete_after()
@@ -129,16 +428,17 @@ class InsertCharacterAction(EditAction):
 class DeleteRangeAction(EditAction):
     def __init__(self, model, range_: LocationRange, deleted_text: str):
         self.model = model
-        self.range = range_
+        range_ = range_.ordered()
+        self.range = LocationRange(Location(range_.start.row, range_.start.column),
+                                   Location(range_.end.row, range_.end.column))
         self.deleted_text = deleted_text
 
     def execute_do(self):
-        self.model.setSelectionRange(self.range)
-        self.model.deleteRange()
+        self.model.replace(self.range, "")
 
     def execute_undo(self):
-        self.model.cursorLocation = Location(self.range.start.row, self.range.start.column)
-        self.model.insert_text(self.deleted_text)
+        start = self.range.start
+        self.model.replace(LocationRange(start, start), self.deleted_text)
 class DeleteBeforeAction(EditAction):
     def __init__(self, model):
         self.model = model
@@ -227,7 +527,7 @@ class ClipboardStack:
 
 
 class CursorObserver:
-    def __init__(self, editor_canvas: tk.Canvas, line_height: int, char_width: int):
+    def __init__(self, editor_canvas, line_height: int, char_width: int):
         self.canvas = editor_canvas
         self.line_height = line_height
         self.char_width = char_width
@@ -239,7 +539,7 @@ class CursorObserver:
         self.canvas.create_line(cursor_x, cursor_y,
                                 cursor_x, cursor_y + self.line_height, fill="red", width=2, tag="cursor")
 class TextObserver:
-    def __init__(self, editor_canvas: tk.Canvas, model, line_height: int, char_width: int):
+    def __init__(self, editor_canvas, model, line_height: int, char_width: int):
         self.canvas = editor_canvas
         self.model = model  
         self.line_height = line_height
@@ -273,24 +573,321 @@ class TextObserver:
             self.canvas.create_text(5, (i) * self.line_height, anchor="nw",
                                     text=line, font=("Courier", 12), tags="text")
 
-            
+
+
+class LineStore(MutableSequence):
+    # Linije su spremljene u komadima (chunkovima) od najvise 2 * CHUNK_SIZE.
+    # freeze() vraca nepromjenjiv pogled koji dijeli komade sa spremnikom;
+    # nakon toga spremnik kopira samo vanjske liste (O(linije / CHUNK_SIZE))
+    # i komade koje stvarno mijenja, pa snimke kostaju razmjerno izmjenama.
+    CHUNK_SIZE = 512
+
+    def __init__(self, lines=()):
+        lines = list(lines)
+        size = LineStore.CHUNK_SIZE
+        self._chunks = [lines[i:i + size] for i in range(0, len(lines), size)]
+        self._starts = list(range(0, len(lines), size))
+        self._owned = [True] * len(self._chunks)
+        self._length = len(lines)
+        self._shared = False
+        self._frozen = False
+        self.edits = 0
+
+    def _view(self, frozen: bool):
+        view = LineStore.__new__(LineStore)
+        view._chunks = self._chunks
+        view._starts = self._starts
+        view._owned = None
+        view._length = self._length
+        view._shared = True
+        view._frozen = frozen
+        view.edits = 0
+        return view
+
+    def freeze(self):
+        if self._frozen:
+            return self
+        self._shared = True
+        return self._view(True)
+
+    def thaw(self):
+        return self._view(False)
+
+    def _prepare_write(self):
+        if self._frozen:
+            raise TypeError("DocumentSnapshot is read-only")
+        self.edits += 1
+        if self._shared:
+            self._chunks = list(self._chunks)
+            self._starts = list(self._starts)
+            self._owned = [False] * len(self._chunks)
+            self._shared = False
+
+    def _locate(self, row: int):
+        return bisect.bisect_right(self._starts, row) - 1
+
+    def _index(self, index: int):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("line index out of range")
+        return index
+
+    def _splice(self, start: int, stop: int, new_lines):
+        self._prepare_write()
+        stop = max(start, stop)
+        size = LineStore.CHUNK_SIZE
+        if self._chunks:
+            ci = self._locate(start)
+            cj = self._locate(stop - 1) if stop > start else ci
+            middle = self._chunks[ci][:start - self._starts[ci]]
+            middle.extend(new_lines)
+            middle.extend(self._chunks[cj][stop - self._starts[cj]:])
+            if len(middle) < size // 2 and cj + 1 < len(self._chunks):
+                cj += 1
+                middle.extend(self._chunks[cj])
+            row = self._starts[ci]
+        else:
+            ci, cj, row = 0, -1, 0
+            middle = list(new_lines)
+
+        if len(middle) <= 2 * size:
+            pieces = [middle] if middle else []
+        else:
+            pieces = [middle[i:i + size] for i in range(0, len(middle), size)]
+        self._chunks[ci:cj + 1] = pieces
+        self._owned[ci:cj + 1] = [True] * len(pieces)
+
+        starts = self._starts[:ci]
+        for chunk in self._chunks[ci:]:
+            starts.append(row)
+            row += len(chunk)
+        self._starts = starts
+        self._length = row
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return list(self)[index]
+            result = []
+            ci = self._locate(start)
+            while start < stop:
+                chunk = self._chunks[ci]
+                offset = start - self._starts[ci]
+                part = chunk[offset:offset + stop - start]
+                result.extend(part)
+                start += len(part)
+                ci += 1
+            return result
+        index = self._index(index)
+        ci = self._locate(index)
+        return self._chunks[ci][index - self._starts[ci]]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("extended slices are not supported")
+            self._splice(start, stop, value)
+            return
+        index = self._index(index)
+        self._prepare_write()
+        ci = self._locate(index)
+        if not self._owned[ci]:
+            self._chunks[ci] = list(self._chunks[ci])
+            self._owned[ci] = True
+        self._chunks[ci][index - self._starts[ci]] = value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("extended slices are not supported")
+            self._splice(start, stop, ())
+            return
+        index = self._index(index)
+        self._splice(index, index + 1, ())
+
+    def insert(self, index: int, value):
+        if index < 0:
+            index = max(0, index + self._length)
+        self._splice(min(index, self._length), min(index, self._length), (value,))
+
+    # Metode liste koje pluginovi pisani za `model.lines: list` cesto koriste.
+    def extend(self, values):
+        self._splice(self._length, self._length, list(values))
+
+    def clear(self):
+        self._splice(0, self._length, ())
+
+    def copy(self):
+        return list(self)
+
+    def sort(self, *, key=None, reverse=False):
+        self._splice(0, self._length, sorted(self, key=key, reverse=reverse))
+
+    def __add__(self, other):
+        if isinstance(other, (list, LineStore)):
+            return list(self) + list(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, list):
+            return other + list(self)
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, LineStore):
+            if other._chunks is self._chunks:
+                return True
+            return self._length == other._length and all(a == b for a, b in zip(self, other))
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"LineStore({list(self)!r})"
+
+    def unique_bytes(self, newer: "LineStore"):
+        if newer._chunks is self._chunks:
+            return 0
+        size = sys.getsizeof(self._chunks) + sys.getsizeof(self._starts)
+        newer_chunks = {id(chunk) for chunk in newer._chunks}
+        own = [chunk for chunk in self._chunks if id(chunk) not in newer_chunks]
+        if not own:
+            return size
+        own_ids = {id(chunk) for chunk in self._chunks}
+        newer_lines = {id(line) for chunk in newer._chunks if id(chunk) not in own_ids for line in chunk}
+        seen = set()
+        for chunk in own:
+            size += sys.getsizeof(chunk)
+            for line in chunk:
+                if id(line) not in newer_lines and id(line) not in seen:
+                    seen.add(id(line))
+                    size += sys.getsizeof(line)
+        return size
+
+    def estimate_bytes(self):
+        if not self._length:
+            return 0
+        step = max(1, self._length // 64)
+        sample = [sys.getsizeof(self[i]) for i in range(0, self._length, step)]
+        return self._length * (8 + sum(sample) / len(sample))
+
+
+class DocumentSnapshot:
+    def __init__(self, lines: LineStore, version: int, cursorLocation: Location):
+        self._lines = lines
+        self.version = version
+        self.cursorLocation = Location(cursorLocation.row, cursorLocation.column)
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __getitem__(self, index):
+        return self._lines[index]
+
+    def __iter__(self):
+        return iter(self._lines)
+
+    def iteratorAllLines(self):
+        for i, line in enumerate(self._lines):
+            yield i, line
+
+    def iteratorLinesRange(self, index1: int, index2: int):
+        for i, line in enumerate(self._lines[index1:index2], start=index1):
+            yield i, line
+
+    def get_text(self):
+        return '\n'.join(self._lines)
+
+    def __repr__(self):
+        return f"DocumentSnapshot(version={self.version}, lines={len(self._lines)})"
+
 
 class TextEditorModel:
     def __init__(self, text: str):
+        self.version = 0
         self.lines = text.split('\n')
         self.selectionRange = None
         self.cursorObservers = []
         self.textObservers = []
         self.cursorLocation = Location(0,0)
-        
-        
+        self.version = 0
+        self._suspendCount = 0
+
+    @property
+    def lines(self):
+        return self._lines
+
+    @lines.setter
+    def lines(self, lines):
+        self.version += 1
+        if isinstance(lines, LineStore):
+            self._lines = lines.thaw() if lines._frozen else lines
+        else:
+            self._lines = LineStore(lines)
+
+    def snapshot(self):
+        # Snimka dijeli komade linija s modelom (copy-on-write po komadu).
+        # Poziva se iz GUI niti, a citati se moze iz bilo koje niti.
+        return DocumentSnapshot(self._lines.freeze(), self.version, self.cursorLocation)
+
+    def _begin_edit(self):
+        self.version += 1
+
+    def edit_state(self):
+        # Mijenja se i kad plugin pise izravno u model.lines, bez _begin_edit.
+        return self.version, self._lines.edits
+
+    def restore(self, snapshot: DocumentSnapshot):
+        self.version += 1
+        self.lines = snapshot._lines
+        self.cursorLocation = Location(snapshot.cursorLocation.row, snapshot.cursorLocation.column)
+        self.setSelectionRange(None)
+        self.notify_textObservers()
+        self.notify_cursorObservers(self.cursorLocation)
+
+    def suspend_notifications(self):
+        self._suspendCount += 1
+
+    def resume_notifications(self):
+        self._suspendCount -= 1
+        if self._suspendCount == 0:
+            self.notify_textObservers()
+            self.notify_cursorObservers(self.cursorLocation)
+
+    def set_text(self, text: str):
+        self._begin_edit()
+        self.lines = text.split('\n')
+        self.cursorLocation = Location(0, 0)
+        self.setSelectionRange(None)
+        self.notify_textObservers()
+        self.notify_cursorObservers(self.cursorLocation)
+
     def add_textObserver (self, observer:TextObserver):
         self.textObservers.append(observer)
     def remove_textObserver(self, observer: TextObserver):
         self.textObservers.remove(observer)
     def notify_textObservers(self):
+        if self._suspendCount:
+            return
+        profiler = Profiler.get_instance()
         for observer in self.textObservers:
-            observer.update(self.lines)
+            if profiler.enabled:
+                start = time.perf_counter()
+                observer.update(self.lines)
+                profiler.record(f"{type(observer).__name__}.update", "observer", start)
+            else:
+                observer.update(self.lines)
 
     def add_cursorObserver (self, observer: CursorObserver):
         self.cursorObservers.append(observer)
@@ -298,53 +895,76 @@ class TextEditorModel:
     def remove_cursorObserver(self, observer: CursorObserver):
         self.CursorObservers.remove(observer)
     def notify_cursorObservers(self,loc:Location):
+        if self._suspendCount:
+            return
+        profiler = Profiler.get_instance()
         for observer in self.cursorObservers:
-            observer.update(loc)
+            if profiler.enabled:
+                start = time.perf_counter()
+                observer.update(loc)
+                profiler.record(f"{type(observer).__name__}.update", "observer", start)
+            else:
+                observer.update(loc)
     def delete_before (self):
         if (self.cursorLocation.column>0):
+            self._begin_edit()
             new_lines = self.lines[self.cursorLocation.row][:self.cursorLocation.column-1]+self.lines[self.cursorLocation.row][self.cursorLocation.column:]
             self.lines[self.cursorLocation.row] = new_lines
             self.notify_textObservers()
 
             self.move_cursor_left()
         elif (len(self.lines)>self.cursorLocation.row>0):
+            self._begin_edit()
             after = Location(self.cursorLocation.row-1, len(self.lines[self.cursorLocation.row-1]))
             self.lines[self.cursorLocation.row-1]+=self.lines[self.cursorLocation.row]
-            self.lines.remove(self.lines[self.cursorLocation.row])
+            del self.lines[self.cursorLocation.row]
             self.notify_textObservers()
             self.cursorLocation = after
             self.notify_cursorObservers(self.cursorLocation)
                 
     def delete_after(self):
             if (self.cursorLocation.column<len(self.lines[self.cursorLocation.row])):
+                self._begin_edit()
                 new_lines = self.lines[self.cursorLocation.row][:self.cursorLocation.column]+self.lines[self.cursorLocation.row][self.cursorLocation.column+1:]
                 self.lines[self.cursorLocation.row] = new_lines
                 self.notify_textObservers()
 
                 
     def deleteRange(self):
-        r=self.getSelectionRange()
-        start = r.start
-        end = r.end
-        
+        self.replace(self.getSelectionRange(), "")
+
+    def get_text(self, range_: LocationRange):
+        range_ = range_.ordered()
+        start = range_.start
+        end = range_.end
         if start.row == end.row:
-            line = self.lines[start.row]
-            new_line = line[:start.column] + line[end.column:]
-            self.lines[start.row] = new_line
-        else:
-            first_line_part = self.lines[start.row][:start.column]
-            last_line_part = self.lines[end.row][end.column:]
-            self.lines[start.row] = first_line_part + last_line_part
-            
-            for i in range(end.row, start.row, -1):
-                del self.lines[i]
-        
-        self.cursorLocation = Location(start.row, start.column)
-        self.cursorLocation = r.start
+            return self.lines[start.row][start.column:end.column]
+        parts = self.lines[start.row:end.row + 1]
+        parts[0] = parts[0][start.column:]
+        parts[-1] = parts[-1][:end.column]
+        return '\n'.join(parts)
+
+    def replace(self, range_: LocationRange, text: str):
+        range_ = range_.ordered()
+        start = range_.start
+        end = range_.end
+        removed = self.get_text(range_)
+        self._begin_edit()
+
+        new_lines = text.split('\n')
+        end_column = len(new_lines[-1])
+        if len(new_lines) == 1:
+            end_column += start.column
+        new_lines[0] = self.lines[start.row][:start.column] + new_lines[0]
+        new_lines[-1] = new_lines[-1] + self.lines[end.row][end.column:]
+        self.lines[start.row:end.row + 1] = new_lines
+
+        self.cursorLocation = Location(start.row + len(new_lines) - 1, end_column)
         self.setSelectionRange(None)
         self.notify_textObservers()
         self.notify_cursorObservers(self.cursorLocation)
-        
+        return removed
+
     def setSelectionRange(self, range:LocationRange):
         self.selectionRange = range
     def getSelectionRange(self):
@@ -395,6 +1015,7 @@ class TextEditorModel:
         row = self.cursorLocation.row
         col = self.cursorLocation.column
         line = self.lines[row]
+        self._begin_edit()
         
         if c == '\n':  
             before = line[:col]
@@ -413,371 +1034,182 @@ class TextEditorModel:
         self.notify_cursorObservers(self.cursorLocation)
 
     def insert_text(self, text):
-        for c in text:
-            self.insert_char(c)
-
-class TextEditor(tk.Canvas):
-    def __init__(self, master, model: TextEditorModel, **kwargs):
-        super().__init__(master, **kwargs)
-        self.model = model
-        self.line_height = 20
-        self.char_width = 10
-        self.font = ("Courier", 12)
-        self.cursorObserver = CursorObserver(self, self.line_height, self.char_width)
-        self.model.add_cursorObserver(self.cursorObserver)
-        self.textObserver = TextObserver(self, self.model, self.line_height, self.char_width)
-        self.model.add_textObserver(self.textObserver)
-        self.clipboard = ClipboardStack()
-     
-        self.bind("<Key>", self.on_key_press)
-        self.focus_set()
-        self.draw()
-        menubar = tk.Menu(master)
-        master.config(menu=menubar)
-
-        file_menu = tk.Menu(menubar, tearoff=0)
-        file_menu.add_command(label="Open", command=self.open_file)
-        file_menu.add_command(label="Save", command=self.save_file)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=master.quit)
-        menubar.add_cascade(label="File", menu=file_menu)
-
-        self.edit_menu = tk.Menu(menubar, tearoff=0)
-        self.edit_menu.add_command(label="Undo", command=self.undo, state="disabled")
-        self.edit_menu.add_command(label="Redo", command=self.redo, state="disabled")
-        self.edit_menu.add_separator()
-        self.edit_menu.add_command(label="Cut", command=self.cut, state="disabled")
-        self.edit_menu.add_command(label="Copy", command=self.copy, state="disabled")
-        self.edit_menu.add_command(label="Paste", command=self.paste, state="disabled")
-        self.edit_menu.add_command(label="Paste and Take", command=self.paste_and_take, state="disabled")
-        self.edit_menu.add_command(label="Delete selection", command=self.delete_selection, state="disabled")
-        self.edit_menu.add_command(label="Clear document", command=self.clear_document)
-        menubar.add_cascade(label="Edit", menu=self.edit_menu)
-
-        move_menu = tk.Menu(menubar, tearoff=0)
-        move_menu.add_command(label="Cursor to document start", command=self.cursor_to_start)
-        move_menu.add_command(label="Cursor to document end", command=self.cursor_to_end)
-        menubar.add_cascade(label="Move", menu=move_menu)
-
-        toolbar = tk.Frame(master, bd=1, relief=tk.RAISED)
-        self.undo_button = tk.Button(toolbar, text="Undo", command=self.undo, state="disabled")
-        self.redo_button = tk.Button(toolbar, text="Redo", command=self.redo, state="disabled")
-        self.cut_button = tk.Button(toolbar, text="Cut", command=self.cut, state="disabled")
-        self.copy_button = tk.Button(toolbar, text="Copy", command=self.copy, state="disabled")
-        self.paste_button = tk.Button(toolbar, text="Paste", command=self.paste, state="disabled")
-
-        self.undo_button.pack(side=tk.LEFT, padx=2, pady=2)
-        self.redo_button.pack(side=tk.LEFT, padx=2, pady=2)
-        self.cut_button.pack(side=tk.LEFT, padx=2, pady=2)
-        self.copy_button.pack(side=tk.LEFT, padx=2, pady=2)
-        self.paste_button.pack(side=tk.LEFT, padx=2, pady=2)
-
-        toolbar.pack(side=tk.TOP, fill=tk.X)
-        self.statusbar = tk.Label(master, text="", bd=1, relief=tk.SUNKEN, anchor=tk.W)
-        self.statusbar.pack(side=tk.BOTTOM, fill=tk.X)
-        self.update_statusbar()
-        self.plugins = []
-        self.plugins_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Plugins", menu=self.plugins_menu)
-
-
-        UndoManager.get_instance().add_observer(self)
-        self.clipboard.add_observer(self)
-        self.load_plugins()
-
-
-        
-    def load_plugins(self):
-        plugins_folder = "plugins"
-
-        if not os.path.exists(plugins_folder):
-            os.makedirs(plugins_folder)
-
-        sys.path.insert(0, plugins_folder)
-
-        for filename in os.listdir(plugins_folder):
-            if filename.endswith(".py"):
-                module_name = filename[:-3]
-                try:
-                    module = importlib.import_module(module_name)
-                except Exception as e:
-                    print(f"Ne mogu ucitati modul {module_name}: {e}")
-                    continue
-
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if hasattr(obj, "getName") and hasattr(obj, "getDescription") and hasattr(obj, "execute"):
-                        try:
-                            plugin_instance = obj()
-                            self.plugins.append(plugin_instance)
-                            self.plugins_menu.add_command(
-                                label=plugin_instance.getName(),
-                                command=lambda p=plugin_instance: p.execute(self.model, UndoManager.get_instance(), self.clipboard)
-                            )
-                        except Exception as e:
-                            print(f"Ne mogu instancirati plugin {name}: {e}")
-
-    def open_file(self):
-        filepath = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")])
-        if not filepath:
-            return
-        with open(filepath, "r", encoding="utf-8") as file:
-            content = file.read()
-        self.model.lines = content.split('\n')
-        self.model.cursorLocation = Location(0, 0)
-        self.model.setSelectionRange(None)
-        self.model.notify_textObservers()
-        self.model.notify_cursorObservers(self.model.cursorLocation)
-
-    def save_file(self):
-        filepath = filedialog.asksaveasfilename(defaultextension="txt", filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")])
-        if not filepath:
+        if not text:
             return
-        with open(filepath, "w", encoding="utf-8") as file:
-            file.write('\n'.join(self.model.lines))
-           
-    def update_statusbar(self):
-        row = self.model.cursorLocation.row + 1
-        col = self.model.cursorLocation.column + 1
-        total_lines = len(self.model.lines)
-        self.statusbar.config(text=f"Ln {row}, Col {col}    Total lines: {total_lines}")
-
-        
-    def updateUndoStatus(self, canUndo, canRedo):
-        state_undo = "normal" if canUndo else "disabled"
-        state_redo = "normal" if canRedo else "disabled"
-
-        self.undo_button.config(state=state_undo)
-        self.redo_button.config(state=state_redo)
-        self.edit_menu.entryconfig("Undo", state=state_undo)
-        self.edit_menu.entryconfig("Redo", state=state_redo)
-
-    def updateClipboard(self):
-        state_paste = "normal" if not self.clipboard.is_empty() else "disabled"
-
-        self.paste_button.config(state=state_paste)
-        self.edit_menu.entryconfig("Paste", state=state_paste)
-        self.edit_menu.entryconfig("Paste and Take", state=state_paste)
-
-    def updateSelectionDependentItems(self):
-        has_selection = self.model.getSelectionRange() is not None
+        range_ = self.selectionRange
+        if range_ is None:
+            range_ = LocationRange(self.cursorLocation, self.cursorLocation)
+        self.replace(range_, text)
 
-        state_sel = "normal" if has_selection else "disabled"
-        self.cut_button.config(state=state_sel)
-        self.copy_button.config(state=state_sel)
-        self.edit_menu.entryconfig("Cut", state=state_sel)
-        self.edit_menu.entryconfig("Copy", state=state_sel)
-        self.edit_menu.entryconfig("Delete selection", state=state_sel)
+def find_plugins(plugins_folder: str):
+    plugins = []
+    if not os.path.isdir(plugins_folder):
+        return plugins
 
-    def undo(self):
-        UndoManager.get_instance().undo()
-
-    def redo(self):
-        UndoManager.get_instance().redo()
-
-    def cut(self):
-        if self.model.getSelectionRange() is not None:
-            selected_text = self.get_selected_text()
-            self.clipboard.push(selected_text)
-            action = DeleteRangeAction(self.model, self.model.getSelectionRange(), selected_text)
-            UndoManager.get_instance().push(action)
-            action.execute_do()
-
-    def copy(self):
-        if self.model.getSelectionRange() is not None:
-            selected_text = self.get_selected_text()
-            self.clipboard.push(selected_text)
-
-    def paste(self):
-        text = self.clipboard.peek()
-        self.model.insert_text(text)
-
-    def paste_and_take(self):
-        text = self.clipboard.pop()
-        self.model.insert_text(text)
-
-    def delete_selection(self):
-        if self.model.getSelectionRange() is not None:
-            selected_text = self.get_selected_text()
-            action = DeleteRangeAction(self.model, self.model.getSelectionRange(), selected_text)
-            UndoManager.get_instance().push(action)
-            action.execute_do()
-
-    def clear_document(self):
-        self.model.lines = [""]
-        self.model.cursorLocation = Location(0, 0)
-        self.model.setSelectionRange(None)
-        self.model.notify_textObservers()
-        self.model.notify_cursorObservers(self.model.cursorLocation)
-
-    def cursor_to_start(self):
-        self.model.cursorLocation = Location(0, 0)
-        self.model.setSelectionRange(None)
-        self.model.notify_cursorObservers(self.model.cursorLocation)
-
-    def cursor_to_end(self):
-        last_row = len(self.model.lines) - 1
-        last_col = len(self.model.lines[last_row])
-        self.model.cursorLocation = Location(last_row, last_col)
-        self.model.setSelectionRange(None)
-        self.model.notify_cursorObservers(self.model.cursorLocation)
-
-    def get_selected_text(self):
-        selection = self.model.getSelectionRange()
-        if selection is None:
-            return ""
-
-        lines = self.model.lines
-        start = selection.start
-        end = selection.end
+    if plugins_folder not in sys.path:
+        sys.path.insert(0, plugins_folder)
 
-        if start.row == end.row:
-            return lines[start.row][start.column:end.column]
+    for filename in sorted(os.listdir(plugins_folder)):
+        if filename.endswith(".py"):
+            module_name = filename[:-3]
+            try:
+                module = importlib.import_module(module_name)
+            except Exception as e:
+                print(f"Ne mogu ucitati modul {module_name}: {e}")
+                continue
+
+            for name, obj in inspect.getmembers(module, inspect.isclass):
+                if hasattr(obj, "getName") and hasattr(obj, "getDescription") and hasattr(obj, "execute"):
+                    try:
+                        plugins.append(obj())
+                    except Exception as e:
+                        print(f"Ne mogu instancirati plugin {name}: {e}")
+    return plugins
+
+
+def save_lines(filepath: str, lines, chunk_size: int = 4096, newline=None):
+    # Pise u privremenu datoteku u istom direktoriju pa je atomski
+    # zamjenjuje, tako da prekinuto spremanje ne ostavlja pola datoteke.
+    # `newline` ima isto znacenje kao u open(); None pise os.linesep.
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8", newline=newline) as file:
+            for i in range(0, len(lines), chunk_size):
+                if i:
+                    file.write('\n')
+                file.write('\n'.join(lines[i:i + chunk_size]))
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(filepath):
+            shutil.copymode(filepath, tmp_path)
         else:
-            selected_text = lines[start.row][start.column:] + "\n"
-            for row in range(start.row + 1, end.row):
-                selected_text += lines[row] + "\n"
-            selected_text += lines[end.row][:end.column]
-            return selected_text
-
-    def handle_shift_movement(self, move_function):
-        selection = self.model.getSelectionRange()
+            # mkstemp stvara datoteku s 0600; nova datoteka dobiva prava kao da je otvorena s open().
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
-        if selection is None:
-            loc = Location(self.model.cursorLocation.row, self.model.cursorLocation.column)
-            move_function()
-            new_loc = self.model.cursorLocation
-            if new_loc.row<loc.row or new_loc.column<loc.column:
-                self.model.setSelectionRange(LocationRange( new_loc,loc))
 
-            else:
-                self.model.setSelectionRange(LocationRange(loc, new_loc))
-        else:
-            if self.model.getSelectionRange().start == self.model.cursorLocation:
-                loc = self.model.getSelectionRange().end
-            else:
-                loc = self.model.getSelectionRange().start
-            move_function()
-            new_loc = self.model.cursorLocation
-            if (new_loc.row < loc.row) or (new_loc.row == loc.row and new_loc.column < loc.column):
-                self.model.setSelectionRange(LocationRange( new_loc,loc))
+def load_edit_script(script_path: str):
+    spec = importlib.util.spec_from_file_location("edit_script", script_path)
+    if spec is None:
+        raise ValueError(f"Ne mogu ucitati skriptu {script_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not hasattr(module, "execute"):
+        raise ValueError(f"Skripta {script_path} nema funkciju execute(model, undoManager, clipboardStack)")
+    return module
 
-            else:
-                self.model.setSelectionRange(LocationRange(loc, new_loc))
-        self.model.notify_textObservers()
 
-    def draw(self):
-        self.delete("all")
-        iterator = self.model.iteratorAllLines()
-        for i, line in iterator:
-            self.create_text(5, (i) * self.line_height, anchor="nw",
-                             text=line, font=self.font, tag="text")
-        self.model.notify_cursorObservers(self.model.cursorLocation)
+def load_batch_runner(plugin_name, script_path, plugins_folder):
+    if script_path is not None:
+        return load_edit_script(script_path)
+    for plugin in find_plugins(plugins_folder):
+        if plugin_name in (plugin.getName(), type(plugin).__name__):
+            return plugin
+    raise ValueError(f"Plugin {plugin_name} nije pronaden u {plugins_folder}")
 
 
+_batchRunner = None
 
-    def on_key_press(self, event):
-        key = event.keysym
-        if (key == "Delete" or key == "BackSpace") and self.model.getSelectionRange() is not None:
-            selected_text = self.get_selected_text()
-            action = DeleteRangeAction(self.model, self.model.getSelectionRange(), selected_text)
-            UndoManager.get_instance().push(action)
-            action.execute_do()
 
-        elif key == "Delete":
-            action = DeleteAfterAction(self.model)
-            UndoManager.get_instance().push(action)
-            action.execute_do()
+def _init_batch_worker(plugin_name, script_path, plugins_folder):
+    global _batchRunner
+    _batchRunner = load_batch_runner(plugin_name, script_path, plugins_folder)
 
-        elif key == "BackSpace":
-            action = DeleteBeforeAction(self.model)
-            UndoManager.get_instance().push(action)
-            action.execute_do()
 
-        elif key == "Left":
-            if (event.state & 0x0001):
-                self.handle_shift_movement(self.model.move_cursor_left)
-            else:
-                self.model.setSelectionRange(None)
-                self.model.move_cursor_left()
-                self.model.notify_textObservers()
-        elif key == "Right":
-            if (event.state & 0x0001):
-                self.handle_shift_movement(self.model.move_cursor_right)
-            else:
-                self.model.setSelectionRange(None)
-                self.model.move_cursor_right()
-                self.model.notify_textObservers()
-        elif key == "Up":
-            if (event.state & 0x0001):
-                self.handle_shift_movement(self.model.move_cursor_up)
-            else:
-                self.model.setSelectionRange(None)
-                self.model.move_cursor_up()
-                self.model.notify_textObservers()
-        elif key == "Down":
-            if (event.state & 0x0001):
-                self.handle_shift_movement(self.model.move_cursor_down)
-            else:
-                self.model.setSelectionRange(None)
-                self.model.move_cursor_down()
-                self.model.notify_textObservers()
-                
-        elif (event.state & 0x0004) and key == 'c' and self.model.getSelectionRange() is not None:
-            selected_text = self.get_selected_text()
-            self.clipboard.push(selected_text)
-            
-        elif (event.state & 0x0004) and key == 'x' and self.model.getSelectionRange() is not None:
-            selected_text = self.get_selected_text()
-            self.clipboard.push(selected_text)
-            self.model.deleteRange()
-            
-        elif (event.state & 0x0004) and key == 'v' and not (event.state & 0x0001):
-            text = self.clipboard.peek()
-            self.model.insert_text(text)
-            
-        elif (event.state & 0x0004) and (event.state & 0x0001) and key.lower() == 'v':
-            text = self.clipboard.pop()
-            self.model.insert_text(text)
-            
-        elif key == 'Return':
-            loc = Location(self.model.cursorLocation.row, self.model.cursorLocation.column)
-            action = InsertCharacterAction(self.model, '\n', loc)
-            UndoManager.get_instance().push(action)
-            action.execute_do()
-
-                    
-        elif (event.state & 0x0004) and key.lower() == 'z':
-            UndoManager.get_instance().undo()
-
-        elif (event.state & 0x0004) and key.lower() == 'y':
-            UndoManager.get_instance().redo()
-
-        elif len(event.char) == 1 and event.char.isprintable():
-            loc = Location(self.model.cursorLocation.row, self.model.cursorLocation.column)
-            action = InsertCharacterAction(self.model, event.char, loc)
-            UndoManager.get_instance().push(action)
-            action.execute_do()
-        self.model.notify_cursorObservers(self.model.cursorLocation)
-        self.update_statusbar()
-
-        self.updateClipboard()
-        self.updateUndoStatus(len(UndoManager.get_instance().undoStack) > 0,
-                              len(UndoManager.get_instance().redoStack) > 0)
-        self.updateSelectionDependentItems()
-
-
-
-
-        
-
-
-root = tk.Tk()
-root.title("TextEditor")
-
-initial_text = "Ovo je prvi redak.\nOvo je drugi redak.\nI treći red je ovdje."
-model = TextEditorModel(initial_text)
-
-editor = TextEditor(root, model, width=600, height=400, bg="white")
-editor.pack(fill="both", expand=True)
-
-root.mainloop()
+def _run_batch_file(filepath: str):
+    start = time.perf_counter()
+    try:
+        with open(filepath, "r", encoding="utf-8", newline="") as file:
+            content = file.read()
+        newline = "\r\n" if "\r\n" in content else "\n"
+        if newline != "\n":
+            content = content.replace(newline, "\n")
+        model = TextEditorModel(content)
+        original = model.snapshot()
+        undoManager = UndoManager.get_instance()
+        undoManager.clear()
+        _batchRunner.execute(model, undoManager, ClipboardStack())
+        if model.lines == original._lines:
+            return filepath, time.perf_counter() - start, "UNCHANGED", None
+        save_lines(filepath, model.lines, newline=newline)
+    except Exception as e:
+        return filepath, time.perf_counter() - start, "FAILED", f"{type(e).__name__}: {e}"
+    return filepath, time.perf_counter() - start, "OK", None
+
+
+def run_batch(files, plugin_name=None, script_path=None, plugins_folder="plugins", jobs=None):
+    load_batch_runner(plugin_name, script_path, plugins_folder)
+
+    counts = {"FAILED": 0, "UNCHANGED": 0, "OK": 0}
+    busy = 0.0
+
+    def report(filepath, elapsed, status, error):
+        nonlocal busy
+        busy += elapsed
+        counts[status] += 1
+        if status == "FAILED":
+            print(f"{status:<9} {elapsed * 1000:10.1f} ms  {filepath}: {error}")
+        else:
+            print(f"{status:<9} {elapsed * 1000:10.1f} ms  {filepath}")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                             initargs=(plugin_name, script_path, plugins_folder)) as executor:
+        futures = {}
+        for filepath in files:
+            try:
+                futures[executor.submit(_run_batch_file, filepath)] = filepath
+            except BrokenProcessPool as e:
+                report(filepath, 0.0, "FAILED", f"{type(e).__name__}: {e}")
+        for future in as_completed(futures):
+            # Pad radnog procesa (ili initializera) rusi cijeli pool; te
+            # datoteke se broje kao neuspjele, a ostali rezultati se ispisuju.
+            try:
+                report(*future.result())
+            except BrokenProcessPool as e:
+                report(futures[future], 0.0, "FAILED", f"{type(e).__name__}: {e}")
+    wall = time.perf_counter() - start
+    failures = counts["FAILED"]
+    print(f"{len(files)} files, {counts['UNCHANGED']} unchanged, {failures} failed, {wall:.2f} s wall, {busy:.2f} s busy")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TextEditor")
+    parser.add_argument("files", nargs="*",
+                        help="datoteke koje se obraduju bez GUI-ja (batch nacin)")
+    runner = parser.add_mutually_exclusive_group()
+    runner.add_argument("--plugin", help="ime plugina (getName() ili ime klase) iz mape s pluginovima")
+    runner.add_argument("--script", help="Python skripta s funkcijom execute(model, undoManager, clipboardStack)")
+    parser.add_argument("--plugins-folder", default="plugins", help="mapa s pluginovima (zadano: plugins)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="broj procesa (zadano: broj jezgri)")
+    parser.add_argument("--profile", action="store_true", help="ukljuci mjerenje performansi od pokretanja")
+    args = parser.parse_args(argv)
+    Profiler.get_instance().enabled = args.profile
+
+    if args.files:
+        if args.plugin is None and args.script is None:
+            parser.error("batch nacin zahtijeva --plugin ili --script")
+        try:
+            failures = run_batch(args.files, args.plugin, args.script, args.plugins_folder, args.jobs)
+        except ValueError as e:
+            parser.error(str(e))
+        sys.exit(1 if failures else 0)
+
+    from textEditorGui import run_gui
+    run_gui()
+
+
+if __name__ == "__main__":
+    # GUI modul uvozi `textEditor`; bez ovoga bi se ucitala druga kopija
+    # modula s vlastitim UndoManager i Profiler singletonima.
+    sys.modules.setdefault("textEditor", sys.modules[__name__])
+    main()
@@ -0,0 +1,423 @@
+import tkinter as tk
+from tkinter import filedialog
+import tkinter.messagebox as messagebox
+from tkinter import simpledialog
+import os
+import time
+
+from textEditor import (ClipboardStack, CursorObserver, DeleteAfterAction, DeleteBeforeAction, DeleteRangeAction,
+                        InsertCharacterAction, Location, LocationRange, Profiler, TextEditorModel, TextObserver,
+                        UndoManager, find_plugins, save_lines)
+
+
+class ProfilerPanel(tk.Toplevel):
+    REFRESH_MS = 1000
+
+    def __init__(self, master, editor):
+        super().__init__(master)
+        self.title("Performance")
+        self.editor = editor
+        self.label = tk.Label(self, justify=tk.LEFT, anchor="nw", font=("Courier", 10))
+        self.label.pack(fill="both", expand=True, padx=4, pady=4)
+        self.refresh_id = None
+        self.bind("<Destroy>", self.on_destroy)
+        self.refresh()
+
+    def on_destroy(self, event):
+        if event.widget is self and self.refresh_id is not None:
+            self.after_cancel(self.refresh_id)
+            self.refresh_id = None
+
+    def refresh(self):
+        profiler = Profiler.get_instance()
+        rows = [f"Profiling: {'on' if profiler.enabled else 'off'}", ""]
+        rows.append(f"{'name':<36}{'count':>8}{'avg ms':>10}{'max ms':>10}")
+        for name, stat in list(profiler.summary().items())[:20]:
+            rows.append(f"{name:<36}{stat['count']:>8}{stat['avg_ms']:>10.3f}{stat['max_ms']:>10.3f}")
+        rows.append("")
+        rows.append(f"canvas items: {len(self.editor.find_all())}")
+        memory = Profiler.memory_usage(UndoManager.get_instance(), self.editor.clipboard)
+        for name, value in memory.items():
+            rows.append(f"{name}: {value}")
+        self.label.config(text="\n".join(rows))
+        self.refresh_id = self.after(ProfilerPanel.REFRESH_MS, self.refresh)
+
+
+class TextEditor(tk.Canvas):
+    def __init__(self, master, model: TextEditorModel, **kwargs):
+        super().__init__(master, **kwargs)
+        self.model = model
+        self.line_height = 20
+        self.char_width = 10
+        self.font = ("Courier", 12)
+        self.cursorObserver = CursorObserver(self, self.line_height, self.char_width)
+        self.model.add_cursorObserver(self.cursorObserver)
+        self.textObserver = TextObserver(self, self.model, self.line_height, self.char_width)
+        self.model.add_textObserver(self.textObserver)
+        self.clipboard = ClipboardStack()
+     
+        self.bind("<Key>", self.on_key_press)
+        self.focus_set()
+        self.draw()
+        menubar = tk.Menu(master)
+        master.config(menu=menubar)
+
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Open", command=self.open_file)
+        file_menu.add_command(label="Save", command=self.save_file)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=master.quit)
+        menubar.add_cascade(label="File", menu=file_menu)
+
+        self.edit_menu = tk.Menu(menubar, tearoff=0)
+        self.edit_menu.add_command(label="Undo", command=self.undo, state="disabled")
+        self.edit_menu.add_command(label="Redo", command=self.redo, state="disabled")
+        self.edit_menu.add_command(label="Revert to version...", command=self.revert_to_version)
+        self.edit_menu.add_command(label="Revert to time...", command=self.revert_to_time)
+        self.edit_menu.add_separator()
+        self.edit_menu.add_command(label="Cut", command=self.cut, state="disabled")
+        self.edit_menu.add_command(label="Copy", command=self.copy, state="disabled")
+        self.edit_menu.add_command(label="Paste", command=self.paste, state="disabled")
+        self.edit_menu.add_command(label="Paste and Take", command=self.paste_and_take, state="disabled")
+        self.edit_menu.add_command(label="Delete selection", command=self.delete_selection, state="disabled")
+        self.edit_menu.add_command(label="Clear document", command=self.clear_document)
+        menubar.add_cascade(label="Edit", menu=self.edit_menu)
+
+        move_menu = tk.Menu(menubar, tearoff=0)
+        move_menu.add_command(label="Cursor to document start", command=self.cursor_to_start)
+        move_menu.add_command(label="Cursor to document end", command=self.cursor_to_end)
+        menubar.add_cascade(label="Move", menu=move_menu)
+
+        self.profiling = tk.BooleanVar(value=Profiler.get_instance().enabled)
+        debug_menu = tk.Menu(menubar, tearoff=0)
+        debug_menu.add_checkbutton(label="Enable profiling", variable=self.profiling, command=self.toggle_profiling)
+        debug_menu.add_command(label="Performance panel", command=self.show_profiler_panel)
+        debug_menu.add_command(label="Export profile JSON...", command=self.export_profile_json)
+        debug_menu.add_command(label="Export Chrome trace...", command=self.export_chrome_trace)
+        debug_menu.add_command(label="Reset profile", command=Profiler.get_instance().reset)
+        menubar.add_cascade(label="Debug", menu=debug_menu)
+        self.profiler_panel = None
+
+        toolbar = tk.Frame(master, bd=1, relief=tk.RAISED)
+        self.undo_button = tk.Button(toolbar, text="Undo", command=self.undo, state="disabled")
+        self.redo_button = tk.Button(toolbar, text="Redo", command=self.redo, state="disabled")
+        self.cut_button = tk.Button(toolbar, text="Cut", command=self.cut, state="disabled")
+        self.copy_button = tk.Button(toolbar, text="Copy", command=self.copy, state="disabled")
+        self.paste_button = tk.Button(toolbar, text="Paste", command=self.paste, state="disabled")
+
+        self.undo_button.pack(side=tk.LEFT, padx=2, pady=2)
+        self.redo_button.pack(side=tk.LEFT, padx=2, pady=2)
+        self.cut_button.pack(side=tk.LEFT, padx=2, pady=2)
+        self.copy_button.pack(side=tk.LEFT, padx=2, pady=2)
+        self.paste_button.pack(side=tk.LEFT, padx=2, pady=2)
+
+        toolbar.pack(side=tk.TOP, fill=tk.X)
+        self.statusbar = tk.Label(master, text="", bd=1, relief=tk.SUNKEN, anchor=tk.W)
+        self.statusbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.update_statusbar()
+        self.plugins = []
+        self.plugins_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Plugins", menu=self.plugins_menu)
+
+
+        UndoManager.get_instance().add_observer(self)
+        self.clipboard.add_observer(self)
+        self.load_plugins()
+
+
+        
+    def load_plugins(self):
+        plugins_folder = "plugins"
+
+        if not os.path.exists(plugins_folder):
+            os.makedirs(plugins_folder)
+
+        for plugin_instance in find_plugins(plugins_folder):
+            self.plugins.append(plugin_instance)
+            self.plugins_menu.add_command(
+                label=plugin_instance.getName(),
+                command=lambda p=plugin_instance: p.execute(self.model, UndoManager.get_instance(), self.clipboard)
+            )
+
+    def open_file(self):
+        filepath = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")])
+        if not filepath:
+            return
+        with open(filepath, "r", encoding="utf-8") as file:
+            content = file.read()
+        self.model.set_text(content)
+
+    def save_file(self):
+        filepath = filedialog.asksaveasfilename(defaultextension="txt", filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")])
+        if not filepath:
+            return
+        save_lines(filepath, self.model.lines)
+           
+    def update_statusbar(self):
+        row = self.model.cursorLocation.row + 1
+        col = self.model.cursorLocation.column + 1
+        total_lines = len(self.model.lines)
+        self.statusbar.config(text=f"Ln {row}, Col {col}    Total lines: {total_lines}")
+
+        
+    def updateUndoStatus(self, canUndo, canRedo):
+        state_undo = "normal" if canUndo else "disabled"
+        state_redo = "normal" if canRedo else "disabled"
+
+        self.undo_button.config(state=state_undo)
+        self.redo_button.config(state=state_redo)
+        self.edit_menu.entryconfig("Undo", state=state_undo)
+        self.edit_menu.entryconfig("Redo", state=state_redo)
+
+    def updateClipboard(self):
+        state_paste = "normal" if not self.clipboard.is_empty() else "disabled"
+
+        self.paste_button.config(state=state_paste)
+        self.edit_menu.entryconfig("Paste", state=state_paste)
+        self.edit_menu.entryconfig("Paste and Take", state=state_paste)
+
+    def updateSelectionDependentItems(self):
+        has_selection = self.model.getSelectionRange() is not None
+
+        state_sel = "normal" if has_selection else "disabled"
+        self.cut_button.config(state=state_sel)
+        self.copy_button.config(state=state_sel)
+        self.edit_menu.entryconfig("Cut", state=state_sel)
+        self.edit_menu.entryconfig("Copy", state=state_sel)
+        self.edit_menu.entryconfig("Delete selection", state=state_sel)
+
+    def undo(self):
+        UndoManager.get_instance().undo()
+
+    def redo(self):
+        UndoManager.get_instance().redo()
+
+    def revert_to_version(self):
+        undoManager = UndoManager.get_instance()
+        last = undoManager.history_length()
+        version = simpledialog.askinteger("Revert to version", f"Version (0-{last}):",
+                                          initialvalue=len(undoManager.undoStack),
+                                          minvalue=0, maxvalue=last, parent=self)
+        if version is None:
+            return
+        undoManager.revert_to_version(version)
+        self.update_statusbar()
+        self.updateSelectionDependentItems()
+
+    def revert_to_time(self):
+        minutes = simpledialog.askfloat("Revert to time", "Minutes ago:", minvalue=0, parent=self)
+        if minutes is None:
+            return
+        UndoManager.get_instance().revert_to_time(time.time() - minutes * 60)
+        self.update_statusbar()
+        self.updateSelectionDependentItems()
+
+    def cut(self):
+        if self.model.getSelectionRange() is not None:
+            selected_text = self.get_selected_text()
+            self.clipboard.push(selected_text)
+            action = DeleteRangeAction(self.model, self.model.getSelectionRange(), selected_text)
+            UndoManager.get_instance().perform(action)
+
+    def copy(self):
+        if self.model.getSelectionRange() is not None:
+            selected_text = self.get_selected_text()
+            self.clipboard.push(selected_text)
+
+    def paste(self):
+        text = self.clipboard.peek()
+        self.model.insert_text(text)
+
+    def paste_and_take(self):
+        text = self.clipboard.pop()
+        self.model.insert_text(text)
+
+    def delete_selection(self):
+        if self.model.getSelectionRange() is not None:
+            selected_text = self.get_selected_text()
+            action = DeleteRangeAction(self.model, self.model.getSelectionRange(), selected_text)
+            UndoManager.get_instance().perform(action)
+
+    def clear_document(self):
+        self.model.set_text("")
+
+    def cursor_to_start(self):
+        self.model.cursorLocation = Location(0, 0)
+        self.model.setSelectionRange(None)
+        self.model.notify_cursorObservers(self.model.cursorLocation)
+
+    def cursor_to_end(self):
+        last_row = len(self.model.lines) - 1
+        last_col = len(self.model.lines[last_row])
+        self.model.cursorLocation = Location(last_row, last_col)
+        self.model.setSelectionRange(None)
+        self.model.notify_cursorObservers(self.model.cursorLocation)
+
+    def toggle_profiling(self):
+        Profiler.get_instance().enabled = self.profiling.get()
+
+    def show_profiler_panel(self):
+        if self.profiler_panel is not None and self.profiler_panel.winfo_exists():
+            self.profiler_panel.lift()
+            return
+        self.profiler_panel = ProfilerPanel(self.master, self)
+
+    def export_profile_json(self):
+        filepath = filedialog.asksaveasfilename(defaultextension="json", filetypes=[("JSON", "*.json")])
+        if not filepath:
+            return
+        memory = Profiler.memory_usage(UndoManager.get_instance(), self.clipboard, exact=True)
+        Profiler.get_instance().export_json(filepath, memory)
+
+    def export_chrome_trace(self):
+        filepath = filedialog.asksaveasfilename(defaultextension="json", filetypes=[("Chrome trace", "*.json")])
+        if not filepath:
+            return
+        Profiler.get_instance().export_chrome_trace(filepath)
+
+    def get_selected_text(self):
+        selection = self.model.getSelectionRange()
+        if selection is None:
+            return ""
+        return self.model.get_text(selection)
+
+    def handle_shift_movement(self, move_function):
+        selection = self.model.getSelectionRange()
+
+        if selection is None:
+            loc = Location(self.model.cursorLocation.row, self.model.cursorLocation.column)
+            move_function()
+            new_loc = self.model.cursorLocation
+            if (new_loc.row < loc.row) or (new_loc.row == loc.row and new_loc.column < loc.column):
+                self.model.setSelectionRange(LocationRange( new_loc,loc))
+
+            else:
+                self.model.setSelectionRange(LocationRange(loc, new_loc))
+        else:
+            if self.model.getSelectionRange().start == self.model.cursorLocation:
+                loc = self.model.getSelectionRange().end
+            else:
+                loc = self.model.getSelectionRange().start
+            move_function()
+            new_loc = self.model.cursorLocation
+            if (new_loc.row < loc.row) or (new_loc.row == loc.row and new_loc.column < loc.column):
+                self.model.setSelectionRange(LocationRange( new_loc,loc))
+
+            else:
+                self.model.setSelectionRange(LocationRange(loc, new_loc))
+        self.model.notify_textObservers()
+
+    def draw(self):
+        self.delete("all")
+        iterator = self.model.iteratorAllLines()
+        for i, line in iterator:
+            self.create_text(5, (i) * self.line_height, anchor="nw",
+                             text=line, font=self.font, tag="text")
+        self.model.notify_cursorObservers(self.model.cursorLocation)
+
+
+
+    def on_key_press(self, event):
+        profiler = Profiler.get_instance()
+        start = profiler.input_start(event.time) if profiler.enabled else None
+        key = event.keysym
+        if (key == "Delete" or key == "BackSpace") and self.model.getSelectionRange() is not None:
+            selected_text = self.get_selected_text()
+            action = DeleteRangeAction(self.model, self.model.getSelectionRange(), selected_text)
+            UndoManager.get_instance().perform(action)
+
+        elif key == "Delete":
+            action = DeleteAfterAction(self.model)
+            UndoManager.get_instance().perform(action)
+
+        elif key == "BackSpace":
+            action = DeleteBeforeAction(self.model)
+            UndoManager.get_instance().perform(action)
+
+        elif key == "Left":
+            if (event.state & 0x0001):
+                self.handle_shift_movement(self.model.move_cursor_left)
+            else:
+                self.model.setSelectionRange(None)
+                self.model.move_cursor_left()
+                self.model.notify_textObservers()
+        elif key == "Right":
+            if (event.state & 0x0001):
+                self.handle_shift_movement(self.model.move_cursor_right)
+            else:
+                self.model.setSelectionRange(None)
+                self.model.move_cursor_right()
+                self.model.notify_textObservers()
+        elif key == "Up":
+            if (event.state & 0x0001):
+                self.handle_shift_movement(self.model.move_cursor_up)
+            else:
+                self.model.setSelectionRange(None)
+                self.model.move_cursor_up()
+                self.model.notify_textObservers()
+        elif key == "Down":
+            if (event.state & 0x0001):
+                self.handle_shift_movement(self.model.move_cursor_down)
+            else:
+                self.model.setSelectionRange(None)
+                self.model.move_cursor_down()
+                self.model.notify_textObservers()
+                
+        elif (event.state & 0x0004) and key == 'c' and self.model.getSelectionRange() is not None:
+            selected_text = self.get_selected_text()
+            self.clipboard.push(selected_text)
+            
+        elif (event.state & 0x0004) and key == 'x' and self.model.getSelectionRange() is not None:
+            self.cut()
+            
+        elif (event.state & 0x0004) and key == 'v' and not (event.state & 0x0001):
+            text = self.clipboard.peek()
+            self.model.insert_text(text)
+            
+        elif (event.state & 0x0004) and (event.state & 0x0001) and key.lower() == 'v':
+            text = self.clipboard.pop()
+            self.model.insert_text(text)
+            
+        elif key == 'Return':
+            self.delete_selection()
+            loc = Location(self.model.cursorLocation.row, self.model.cursorLocation.column)
+            action = InsertCharacterAction(self.model, '\n', loc)
+            UndoManager.get_instance().perform(action)
+
+                    
+        elif (event.state & 0x0004) and key.lower() == 'z':
+            UndoManager.get_instance().undo()
+
+        elif (event.state & 0x0004) and key.lower() == 'y':
+            UndoManager.get_instance().redo()
+
+        elif len(event.char) == 1 and event.char.isprintable():
+            self.delete_selection()
+            loc = Location(self.model.cursorLocation.row, self.model.cursorLocation.column)
+            action = InsertCharacterAction(self.model, event.char, loc)
+            UndoManager.get_instance().perform(action)
+        self.model.notify_cursorObservers(self.model.cursorLocation)
+        self.update_statusbar()
+
+        self.updateClipboard()
+        self.updateUndoStatus(len(UndoManager.get_instance().undoStack) > 0,
+                              len(UndoManager.get_instance().redoStack) > 0)
+        self.updateSelectionDependentItems()
+
+        if start is not None:
+            self.update_idletasks()
+            profiler.record("on_key_press", "input", start, {"key": key})
+            profiler.counter("canvas items", len(self.find_all()))
+
+
+def run_gui():
+    root = tk.Tk()
+    root.title("TextEditor")
+
+    initial_text = "Ovo je prvi redak.\nOvo je drugi redak.\nI treći red je ovdje."
+    model = TextEditorModel(initial_text)
+
+    editor = TextEditor(root, model, width=600, height=400, bg="white")
+    editor.pack(fill="both", expand=True)
+
+    root.mainloop()